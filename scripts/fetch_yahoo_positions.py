@@ -17,6 +17,7 @@ import argparse
 import sys
 import unicodedata
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path so we can import src modules
@@ -34,28 +35,58 @@ YAHOO_POSITIONS = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "OF",
                     "DH", "SP", "RP", "P"]
 
 # Yahoo positions to exclude from stored eligibility (not real positions)
-YAHOO_META_POSITIONS = {"Util", "BN", "DL", "IL", "IL+", "NA"}
+YAHOO_META_POSITIONS = frozenset({"Util", "BN", "DL", "IL", "IL+", "NA"})
 
+# Yahoo outfield sub-positions, stored as plain OF
+YAHOO_OUTFIELD_POSITIONS = frozenset({"LF", "CF", "RF"})
 
+
+def _build_accent_map() -> dict[int, str]:
+    """Map Latin-1 and Latin Extended letters to their unaccented form."""
+    accent_map = {}
+    for codepoint in range(0x00C0, 0x0250):
+        char = chr(codepoint)
+        stripped = "".join(
+            c for c in unicodedata.normalize("NFKD", char)
+            if not unicodedata.combining(c)
+        )
+        if stripped != char:
+            accent_map[codepoint] = stripped
+    return accent_map
+
+
+# Covers the accented letters found on MLB rosters; anything else still
+# goes through full NFKD decomposition in normalize_name
+_ACCENT_MAP = _build_accent_map()
+
+# Checked in order, so " jr." is tried before " jr"
+_NAME_SUFFIXES = (" jr.", " jr", " sr.", " sr", " iii", " ii", " iv")
+
+
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize a player name for matching.
 
     Strips accents, lowercases, removes suffixes like Jr./III/II,
-    and strips parenthetical notes.
+    and strips parenthetical notes. Results are cached, since the same
+    names are normalized again on every matching pass.
     """
     # Remove parenthetical suffixes like "(Hitter)" or "(SP)"
     if "(" in name:
         name = name[:name.index("(")]
 
     # Strip accents/diacritics
-    name = unicodedata.normalize("NFKD", name)
-    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = name.translate(_ACCENT_MAP)
+    if not name.isascii():
+        combining = unicodedata.combining
+        name = unicodedata.normalize("NFKD", name)
+        name = "".join(c for c in name if not combining(c))
 
     # Lowercase and strip
     name = name.lower().strip()
 
     # Remove common suffixes
-    for suffix in [" jr.", " jr", " sr.", " sr", " iii", " ii", " iv"]:
+    for suffix in _NAME_SUFFIXES:
         if name.endswith(suffix):
             name = name[: -len(suffix)].strip()
 
@@ -105,6 +136,13 @@ def match_players(yahoo_players: dict[str, dict], db_players: list[Player],
         else:
             yahoo_by_norm[norm] = yp
 
+    # One matcher per Yahoo name: SequenceMatcher caches its analysis of the
+    # second sequence, so each Yahoo name is indexed once, not once per player
+    yahoo_matchers = [
+        (SequenceMatcher(None, b=yahoo_norm), yp)
+        for yahoo_norm, yp in yahoo_by_norm.items()
+    ]
+
     for player in db_players:
         norm_name = normalize_name(player.name)
 
@@ -121,8 +159,14 @@ def match_players(yahoo_players: dict[str, dict], db_players: list[Player],
         # Fuzzy match (only against non-typed players)
         best_score = 0
         best_yahoo = None
-        for yahoo_norm, yp in yahoo_by_norm.items():
-            score = SequenceMatcher(None, norm_name, yahoo_norm).ratio()
+        for matcher, yp in yahoo_matchers:
+            matcher.set_seq1(norm_name)
+            # The quick ratios are upper bounds on ratio(); skip candidates
+            # that can neither beat the current best nor reach the threshold
+            floor = max(best_score, threshold)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
             if score > best_score:
                 best_score = score
                 best_yahoo = yp
@@ -140,17 +184,39 @@ def format_positions(eligible_positions: list[str]) -> str:
 
     Filters out meta-positions like Util, BN, IL.
     """
-    # Separate Util from other meta-positions
-    non_meta = [p for p in eligible_positions if p not in YAHOO_META_POSITIONS]
+    # Empty and single-position lists are the common case; answer them directly
+    if not eligible_positions:
+        return ""
+    if len(eligible_positions) == 1:
+        position = eligible_positions[0]
+        if position == "Util":
+            return "UTIL"
+        if position in YAHOO_META_POSITIONS:
+            return ""
+        return "OF" if position in YAHOO_OUTFIELD_POSITIONS else position
+
+    # Leagues only have a few dozen distinct eligibility lists, so cache them
+    return _format_positions_cached(tuple(eligible_positions))
+
+
+@lru_cache(maxsize=256)
+def _format_positions_cached(eligible_positions: tuple[str, ...]) -> str:
+    """Cached body of format_positions, keyed on the ordered position tuple."""
+    # One pass: drop meta-positions and fold LF/CF/RF into OF, keeping the
+    # Yahoo order so the first listed position stays first
+    non_meta = []
+    has_outfield = False
+    for p in eligible_positions:
+        if p in YAHOO_META_POSITIONS:
+            continue
+        if p in YAHOO_OUTFIELD_POSITIONS:
+            has_outfield = True
+        else:
+            non_meta.append(p)
+    if has_outfield and "OF" not in non_meta:
+        non_meta.append("OF")
     has_util = "Util" in eligible_positions
 
-    # Normalize OF positions: LF/CF/RF -> OF
-    outfield = {"LF", "CF", "RF"}
-    if any(p in outfield for p in non_meta):
-        non_meta = [p for p in non_meta if p not in outfield]
-        if "OF" not in non_meta:
-            non_meta.append("OF")
-
     # If no real positions but player has Util, keep it as UTIL
     if not non_meta and has_util:
         return "UTIL"
@@ -294,6 +360,7 @@ def main():
                     continue
 
                 # Find best match from search results using type hint
+                player_norm = normalize_name(player.name)
                 best = None
                 for r in results:
                     name = r.get("name", "")
@@ -301,7 +368,6 @@ def main():
                         name = name.get("full", "")
                     type_hint = _extract_name_type_hint(name)
                     norm = normalize_name(name)
-                    player_norm = normalize_name(player.name)
 
                     # Type-specific match for split players
                     if type_hint and type_hint == player.player_type and norm == player_norm:
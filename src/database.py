@@ -1,6 +1,8 @@
 """Database models for the fantasy baseball draft tool."""
 
+import json
 from datetime import datetime, timezone
+from functools import partial
 from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
@@ -169,7 +171,11 @@ class TargetPlayer(Base):
 
 def get_engine(db_path: str = "data/draft.db"):
     """Create database engine."""
-    return create_engine(f"sqlite:///{db_path}")
+    return create_engine(
+        f"sqlite:///{db_path}",
+        # Compact separators keep the per-player sgp_breakdown JSON small
+        json_serializer=partial(json.dumps, separators=(",", ":")),
+    )
 
 
 def init_db(db_path: str = "data/draft.db"):
@@ -553,7 +553,7 @@ def get_remaining_positional_needs(session: Session, settings: LeagueSettings =
         settings = DEFAULT_SETTINGS
 
     # Get total positional demand
-    total_demand = settings.get_positional_demand()
+    total_demand = settings.positional_demand
 
     # Count how many players at each position have been drafted
     drafted_players = session.query(Player).filter(Player.is_drafted == True).all()
@@ -405,7 +405,7 @@ def calculate_all_team_standings(
     Returns:
         Dict mapping team_name -> {category -> projected_position}
     """
-    from .values import analyze_team_category_balance
+    from .values import analyze_team_category_balance, load_team_picks
     from .draft import get_all_teams
 
     if settings is None:
@@ -421,7 +421,8 @@ def calculate_all_team_standings(
     # Calculate SGP totals for each team
     team_sgps = {}
     for team in teams:
-        analysis = analyze_team_category_balance(team.draft_picks, settings)
+        picks = load_team_picks(session, team.id)
+        analysis = analyze_team_category_balance(picks, settings)
         team_sgps[team.name] = analysis["sgp_totals"]
 
     # For each category, rank teams by SGP
@@ -463,7 +464,7 @@ def analyze_team_needs(
         TeamNeedsAnalysis with positional states, recommendations,
         category analysis, and comparative standings
     """
-    from .values import analyze_team_category_balance
+    from .values import analyze_team_category_balance, load_team_picks
     from .draft import get_position_scarcity
 
     if settings is None:
@@ -473,7 +474,7 @@ def analyze_team_needs(
     positional_states = get_team_positional_roster_state(session, team, settings)
 
     # Get category analysis
-    category_analysis = analyze_team_category_balance(team.draft_picks, settings)
+    category_analysis = analyze_team_category_balance(load_team_picks(session, team.id), settings)
 
     # Get position scarcity
     scarcity = get_position_scarcity(session, settings)
@@ -1,6 +1,7 @@
 """League settings and configuration."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass
@@ -84,6 +85,22 @@ class LeagueSettings:
         """
         Calculate how many players at each position will be drafted league-wide.
 
+        Returns a copy of the cached ``positional_demand`` so callers may
+        modify it freely.
+
+        Returns:
+            Dict mapping position codes to number of players needed
+        """
+        return dict(self.positional_demand)
+
+    @cached_property
+    def positional_demand(self) -> dict[str, int]:
+        """
+        Positional demand, computed once per settings instance.
+
+        Settings are treated as immutable once in use; build a new
+        LeagueSettings rather than changing num_teams or roster_spots.
+
         This accounts for composite positions (CI, MI, UTIL) by distributing
         their demand to constituent positions. For example:
         - CI slots increase demand for both 1B and 3B
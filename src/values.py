@@ -1,9 +1,13 @@
 """SGP calculation and dollar value conversion for fantasy baseball players."""
 
-import statistics
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from operator import attrgetter
 
-from .database import Player
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload
+
+from .database import Player, DraftPick
 from .projections import get_all_hitters, get_all_pitchers
 from .settings import LeagueSettings, DEFAULT_SETTINGS
 
@@ -21,6 +25,21 @@ PITCHER_RATE_STATS = ["k9"]  # Weighted by IP
 # Ratio stats (lower is better)
 PITCHER_RATIO_STATS = ["era", "whip"]  # Weighted by IP
 
+# Stat accessors built once at import; attrgetter runs in C instead of
+# going through getattr() with a string for every player and category
+_HITTER_GETTERS = {
+    stat: attrgetter(stat)
+    for stat in HITTER_COUNTING_STATS + HITTER_RATE_STATS + ["ab", "h", "pa"]
+}
+_PITCHER_GETTERS = {
+    stat: attrgetter(stat)
+    for stat in PITCHER_COUNTING_STATS + PITCHER_RATE_STATS + PITCHER_RATIO_STATS + ["ip"]
+}
+
+# Stats read by the preliminary value, fetched as one tuple per player
+_HITTER_PRELIM_STATS = attrgetter("r", "hr", "rbi", "sb", "avg", "obp", "slg", "ab")
+_PITCHER_PRELIM_STATS = attrgetter("w", "sv", "k", "hld", "era", "whip", "ip", "k9")
+
 
 def calculate_all_player_values(session: Session, settings: LeagueSettings = None) -> int:
     """
@@ -43,53 +62,87 @@ def calculate_all_player_values(session: Session, settings: LeagueSettings = Non
     hitters = get_all_hitters(session)
     pitchers = get_all_pitchers(session)
 
+    # Resolve settings-derived values once for both pools
+    total_budget = settings.total_league_budget
+    hitter_budget = total_budget * settings.hitter_budget_pct
+    pitcher_budget = total_budget * (1 - settings.hitter_budget_pct)
+    min_bid = settings.min_bid
+    updates = []
+
     if settings.use_positional_adjustments:
         # Use positional replacement level methodology
         hitter_count = _calculate_positional_values(
             players=hitters,
-            budget=settings.total_league_budget * settings.hitter_budget_pct,
+            budget=hitter_budget,
             categories=settings.hitting_categories,
             player_type="hitter",
             settings=settings,
+            updates=updates,
         )
 
         pitcher_count = _calculate_positional_values(
             players=pitchers,
-            budget=settings.total_league_budget * (1 - settings.hitter_budget_pct),
+            budget=pitcher_budget,
             categories=settings.pitching_categories,
             player_type="pitcher",
             settings=settings,
+            updates=updates,
         )
     else:
         # Use original pool-based calculation (no positional adjustments)
         hitter_count = _calculate_pool_values(
             players=hitters,
             pool_size=settings.total_hitters_drafted,
-            budget=settings.total_league_budget * settings.hitter_budget_pct,
+            budget=hitter_budget,
             categories=settings.hitting_categories,
             player_type="hitter",
-            min_bid=settings.min_bid,
+            updates=updates,
+            min_bid=min_bid,
         )
 
         pitcher_count = _calculate_pool_values(
             players=pitchers,
             pool_size=settings.total_pitchers_drafted,
-            budget=settings.total_league_budget * (1 - settings.hitter_budget_pct),
+            budget=pitcher_budget,
             categories=settings.pitching_categories,
             player_type="pitcher",
-            min_bid=settings.min_bid,
+            updates=updates,
+            min_bid=min_bid,
         )
 
+    _write_player_values(session, updates)
     session.commit()
     return hitter_count + pitcher_count
 
 
+def _write_player_values(session: Session, updates: list[dict]) -> None:
+    """
+    Write calculated values back to the players table.
+
+    All rows go out as a single executemany UPDATE keyed on the primary key,
+    instead of marking every Player dirty and flushing N UPDATE statements.
+    Bulk updates bypass the identity map, so pending changes are flushed
+    first; callers commit afterwards, which expires the loaded players so
+    they re-read the new values.
+
+    Args:
+        session: Database session
+        updates: Dicts with "id", "sgp", "dollar_value" and "sgp_breakdown"
+    """
+    if not updates:
+        return
+
+    session.flush()
+    session.execute(update(Player), updates)
+
+
 def _calculate_positional_values(
     players: list[Player],
     budget: float,
     categories: list[str],
     player_type: str,
     settings: LeagueSettings,
+    updates: list[dict],
 ) -> int:
     """
     Calculate player values using positional replacement level methodology.
@@ -104,6 +157,7 @@ def _calculate_positional_values(
         categories: Stat categories for this pool
         player_type: "hitter" or "pitcher"
         settings: League settings with roster configuration
+        updates: List that receives one value mapping per player
 
     Returns:
         Number of players with values calculated
@@ -112,7 +166,10 @@ def _calculate_positional_values(
         return 0
 
     min_bid = settings.min_bid
-    positional_demand = settings.get_positional_demand()
+    positional_demand = settings.positional_demand
+    cats_lower = tuple(cat.lower() for cat in categories)
+    # Copied for every player without a computed breakdown
+    zero_breakdown = dict.fromkeys(cats_lower, 0.0)
 
     # Determine which positions this player type can fill
     if player_type == "hitter":
@@ -121,13 +178,7 @@ def _calculate_positional_values(
         relevant_positions = ["SP", "RP"]
 
     # Step 1: Calculate preliminary value to rank players at each position
-    preliminary_values = []
-    for player in players:
-        prelim = _calculate_preliminary_value(player, categories, player_type)
-        preliminary_values.append((player, prelim))
-
-    # Sort by preliminary value (descending)
-    preliminary_values.sort(key=lambda x: x[1], reverse=True)
+    preliminary_values = _rank_by_preliminary_value(players, player_type)
 
     # Step 2: Calculate replacement level stats for each position
     positional_replacement_stats = {}
@@ -154,11 +205,11 @@ def _calculate_positional_values(
 
         if replacement_player:
             positional_replacement_stats[position] = _get_player_stats(
-                replacement_player, categories, player_type
+                replacement_player, cats_lower, player_type
             )
         else:
             # Default to zeros
-            positional_replacement_stats[position] = {cat.lower(): 0 for cat in categories}
+            positional_replacement_stats[position] = zero_breakdown
 
     # Step 3: Calculate SGP denominators using the entire player pool
     # We need a pool size for denominator calculation - use total drafted
@@ -171,91 +222,124 @@ def _calculate_positional_values(
     if not draftable_pool:
         return 0
 
-    denominators = _calculate_sgp_denominators(draftable_pool, categories, player_type)
+    denominators = _calculate_sgp_denominators(draftable_pool, cats_lower, player_type)
+
+    # Step 4: Score the draftable pool against each position's replacement
+    # level, then value each player at their best position
+    columns = {}
+    position_sgps = {}
+    for position, replacement_stats in positional_replacement_stats.items():
+        totals, breakdowns = _calculate_pool_sgp(
+            draftable_pool,
+            cats_lower,
+            player_type,
+            replacement_stats,
+            denominators,
+            columns=columns,
+        )
+        position_sgps[position] = (totals.tolist(), breakdowns.tolist())
+
+    # Players without a valued position fall back to the highest-demand position
+    fallback_position = max(
+        positional_replacement_stats.keys(),
+        key=lambda p: positional_demand.get(p, 0),
+        default=None
+    )
 
-    # Step 4: Calculate SGP for each player using their best position's replacement level
     player_sgps = []
-    for player, prelim in preliminary_values[:pool_size]:
+    for index, player in enumerate(draftable_pool):
         # Find the best position for this player (highest SGP)
         best_sgp = None
-        best_breakdown = None
-        best_position = None
+        best_breakdowns = None
 
-        player_positions = _get_player_positions(player, player_type)
-
-        for position in player_positions:
-            if position not in positional_replacement_stats:
+        for position in _get_player_positions(player, player_type):
+            if position not in position_sgps:
                 continue
 
-            replacement_stats = positional_replacement_stats[position]
-            sgp, breakdown = _calculate_player_sgp(
-                player,
-                categories,
-                player_type,
-                replacement_stats,
-                denominators
-            )
-
-            if best_sgp is None or sgp > best_sgp:
-                best_sgp = sgp
-                best_breakdown = breakdown
-                best_position = position
+            totals, breakdowns = position_sgps[position]
+            if best_sgp is None or totals[index] > best_sgp:
+                best_sgp = totals[index]
+                best_breakdowns = breakdowns
 
         # If no position match found, use overall replacement (fallback)
         if best_sgp is None:
-            # Use the position with highest demand as fallback
-            fallback_position = max(
-                positional_replacement_stats.keys(),
-                key=lambda p: positional_demand.get(p, 0),
-                default=None
-            )
             if fallback_position:
-                replacement_stats = positional_replacement_stats[fallback_position]
-                best_sgp, best_breakdown = _calculate_player_sgp(
-                    player,
-                    categories,
-                    player_type,
-                    replacement_stats,
-                    denominators
-                )
+                totals, best_breakdowns = position_sgps[fallback_position]
+                best_sgp = totals[index]
             else:
-                best_sgp = 0
-                best_breakdown = {cat.lower(): 0 for cat in categories}
-
-        player.sgp = best_sgp
-        player.sgp_breakdown = best_breakdown
-        player_sgps.append((player, best_sgp))
+                player_sgps.append((player, 0, zero_breakdown.copy()))
+                continue
 
-    # Step 5: Calculate total positive SGP
-    total_positive_sgp = sum(max(0, sgp) for _, sgp in player_sgps)
+        player_sgps.append((player, best_sgp, dict(zip(cats_lower, best_breakdowns[index]))))
 
-    if total_positive_sgp <= 0:
+    # Steps 5-7: Convert SGP to dollars
+    if not _append_dollar_values(player_sgps, budget, min_bid, updates):
         # Edge case: no positive SGP values
-        for player, _ in player_sgps:
-            player.dollar_value = min_bid
         return len(player_sgps)
 
-    # Step 6: Calculate $/SGP
-    negative_sgp_players = sum(1 for _, sgp in player_sgps if sgp <= 0)
-    adjusted_budget = budget - (negative_sgp_players * min_bid)
-    dollars_per_sgp = adjusted_budget / total_positive_sgp
-
-    # Step 7: Assign dollar values
-    for player, sgp in player_sgps:
-        if sgp > 0:
-            player.dollar_value = max(min_bid, sgp * dollars_per_sgp)
-        else:
-            player.dollar_value = min_bid
-
     # Players outside the draftable pool get minimum value and zero SGP
     for player, _ in preliminary_values[pool_size:]:
-        player.sgp = 0
-        player.dollar_value = min_bid
-        player.sgp_breakdown = {cat.lower(): 0.0 for cat in categories}
+        updates.append({
+            "id": player.id,
+            "sgp": 0,
+            "dollar_value": min_bid,
+            "sgp_breakdown": zero_breakdown.copy(),
+        })
 
     return len(players)
 
 
+def _append_dollar_values(
+    player_sgps: list[tuple[Player, float, dict[str, float]]],
+    budget: float,
+    min_bid: int,
+    updates: list[dict],
+) -> bool:
+    """
+    Convert a pool's SGP totals to dollar values and queue the updates.
+
+    Dollars are spread over positive SGP after reserving the minimum bid for
+    every player at or below zero. The arithmetic runs over one SGP array
+    for the whole pool.
+
+    Args:
+        player_sgps: (player, sgp, breakdown) for each player in the pool
+        budget: Total budget allocated to this pool
+        min_bid: Minimum dollar value for any player
+        updates: List that receives one value mapping per player
+
+    Returns:
+        False if no player had positive SGP (everyone gets min_bid), else True
+    """
+    sgps = np.fromiter(
+        (sgp for _, sgp, _ in player_sgps), dtype=np.float64, count=len(player_sgps)
+    )
+    positive = sgps > 0
+    total_positive_sgp = float(sgps[positive].sum())
+
+    if total_positive_sgp <= 0:
+        dollar_values = [min_bid] * len(player_sgps)
+    else:
+        # Adjust budget for minimum bids on negative SGP players
+        negative_sgp_players = len(player_sgps) - int(positive.sum())
+        adjusted_budget = budget - (negative_sgp_players * min_bid)
+        dollars_per_sgp = adjusted_budget / total_positive_sgp
+        dollar_values = np.where(
+            positive, np.maximum(min_bid, sgps * dollars_per_sgp), min_bid
+        ).tolist()
+
+    updates.extend(
+        {
+            "id": player.id,
+            "sgp": sgp,
+            "dollar_value": dollar_value,
+            "sgp_breakdown": breakdown,
+        }
+        for (player, sgp, breakdown), dollar_value in zip(player_sgps, dollar_values)
+    )
+    return total_positive_sgp > 0
+
+
 def _player_eligible_for_position(player: Player, position: str) -> bool:
     """Check if a player is eligible for a specific position."""
     player_positions = player.position_list
@@ -307,6 +391,7 @@ def _calculate_pool_values(
     budget: float,
     categories: list[str],
     player_type: str,
+    updates: list[dict],
     min_bid: int = 1,
 ) -> int:
     """
@@ -318,6 +403,7 @@ def _calculate_pool_values(
         budget: Total budget allocated to this pool
         categories: Stat categories for this pool
         player_type: "hitter" or "pitcher"
+        updates: List that receives one value mapping per player
         min_bid: Minimum dollar value
 
     Returns:
@@ -326,14 +412,12 @@ def _calculate_pool_values(
     if not players:
         return 0
 
-    # Step 1: Calculate preliminary value to sort players
-    preliminary_values = []
-    for player in players:
-        prelim = _calculate_preliminary_value(player, categories, player_type)
-        preliminary_values.append((player, prelim))
+    cats_lower = tuple(cat.lower() for cat in categories)
+    # Copied for every player outside the draftable pool
+    zero_breakdown = dict.fromkeys(cats_lower, 0.0)
 
-    # Sort by preliminary value (descending)
-    preliminary_values.sort(key=lambda x: x[1], reverse=True)
+    # Step 1: Calculate preliminary value to sort players
+    preliminary_values = _rank_by_preliminary_value(players, player_type)
 
     # Step 2: Take top N players as the draftable pool
     draftable_pool = [p for p, _ in preliminary_values[:pool_size]]
@@ -349,59 +433,62 @@ def _calculate_pool_values(
         return 0
 
     # Step 3: Calculate SGP denominators (std dev for each category)
-    denominators = _calculate_sgp_denominators(draftable_pool, categories, player_type)
+    denominators = _calculate_sgp_denominators(draftable_pool, cats_lower, player_type)
 
     # Step 4: Get replacement level stats
-    replacement_stats = _get_player_stats(replacement_player, categories, player_type)
+    replacement_stats = _get_player_stats(replacement_player, cats_lower, player_type)
 
     # Step 5: Calculate SGP for each player in the pool
-    player_sgps = []
-    for player in draftable_pool:
-        sgp, breakdown = _calculate_player_sgp(
-            player,
-            categories,
-            player_type,
-            replacement_stats,
-            denominators
-        )
-        player.sgp = sgp
-        player.sgp_breakdown = breakdown
-        player_sgps.append((player, sgp))
-
-    # Step 6: Calculate total positive SGP
-    total_positive_sgp = sum(max(0, sgp) for _, sgp in player_sgps)
+    totals, breakdowns = _calculate_pool_sgp(
+        draftable_pool,
+        cats_lower,
+        player_type,
+        replacement_stats,
+        denominators
+    )
+    player_sgps = [
+        (player, sgp, dict(zip(cats_lower, row)))
+        for player, sgp, row in zip(draftable_pool, totals.tolist(), breakdowns.tolist())
+    ]
 
-    if total_positive_sgp <= 0:
+    # Steps 6-8: Convert SGP to dollars
+    if not _append_dollar_values(player_sgps, budget, min_bid, updates):
         # Edge case: no positive SGP values
-        for player in draftable_pool:
-            player.dollar_value = min_bid
         return len(draftable_pool)
 
-    # Step 7: Calculate $/SGP
-    # Adjust budget for minimum bids on negative SGP players
-    negative_sgp_players = sum(1 for _, sgp in player_sgps if sgp <= 0)
-    adjusted_budget = budget - (negative_sgp_players * min_bid)
-    dollars_per_sgp = adjusted_budget / total_positive_sgp
-
-    # Step 8: Assign dollar values
-    for player, sgp in player_sgps:
-        if sgp > 0:
-            player.dollar_value = max(min_bid, sgp * dollars_per_sgp)
-        else:
-            player.dollar_value = min_bid
-
     # Players outside the draftable pool get minimum value and zero SGP
     for player, _ in preliminary_values[pool_size:]:
-        player.sgp = 0
-        player.dollar_value = min_bid
-        player.sgp_breakdown = {cat.lower(): 0.0 for cat in categories}
+        updates.append({
+            "id": player.id,
+            "sgp": 0,
+            "dollar_value": min_bid,
+            "sgp_breakdown": zero_breakdown.copy(),
+        })
 
     return len(players)
 
 
+def _rank_by_preliminary_value(
+    players: list[Player],
+    player_type: str
+) -> list[tuple[Player, float]]:
+    """
+    Pair each player with their preliminary value, sorted best first.
+
+    The sort runs as a stable argsort over a float array, so ties keep
+    their input order exactly as list.sort(reverse=True) would.
+    """
+    prelims = np.fromiter(
+        (_calculate_preliminary_value(player, player_type) for player in players),
+        dtype=float,
+        count=len(players),
+    )
+    order = np.argsort(-prelims, kind="stable")
+    return [(players[i], float(prelims[i])) for i in order.tolist()]
+
+
 def _calculate_preliminary_value(
     player: Player,
-    categories: list[str],
     player_type: str
 ) -> float:
     """
@@ -411,34 +498,33 @@ def _calculate_preliminary_value(
     value = 0.0
 
     if player_type == "hitter":
+        r, hr, rbi, sb, avg, obp, slg, ab = (
+            stat or 0 for stat in _HITTER_PRELIM_STATS(player)
+        )
+
         # Simple sum of normalized stats
-        value += (getattr(player, "r", 0) or 0) / 100.0  # ~100 runs is good
-        value += (getattr(player, "hr", 0) or 0) / 30.0  # ~30 HR is good
-        value += (getattr(player, "rbi", 0) or 0) / 100.0  # ~100 RBI is good
-        value += (getattr(player, "sb", 0) or 0) / 20.0  # ~20 SB is good
+        value += r / 100.0  # ~100 runs is good
+        value += hr / 30.0  # ~30 HR is good
+        value += rbi / 100.0  # ~100 RBI is good
+        value += sb / 20.0  # ~20 SB is good
 
         # Rate stat contributions (above baseline, scaled by playing time)
-        avg = getattr(player, "avg", 0) or 0
-        obp = getattr(player, "obp", 0) or 0
-        slg = getattr(player, "slg", 0) or 0
-        ab = getattr(player, "ab", 0) or 0
         if ab > 0:
             value += (avg - 0.250) * (ab / 500.0) * 10
             value += (obp - 0.320) * (ab / 500.0) * 10
             value += (slg - 0.400) * (ab / 500.0) * 5
     else:
+        w, sv, k, hld, era, whip, ip, k9 = (
+            stat or 0 for stat in _PITCHER_PRELIM_STATS(player)
+        )
+
         # Pitcher preliminary value
-        value += (getattr(player, "w", 0) or 0) / 15.0  # ~15 wins is good
-        value += (getattr(player, "sv", 0) or 0) / 30.0  # ~30 saves is good
-        value += (getattr(player, "k", 0) or 0) / 200.0  # ~200 K is good
-        value += (getattr(player, "hld", 0) or 0) / 20.0  # ~20 holds is good
+        value += w / 15.0  # ~15 wins is good
+        value += sv / 30.0  # ~30 saves is good
+        value += k / 200.0  # ~200 K is good
+        value += hld / 20.0  # ~20 holds is good
 
         # ERA/WHIP contribution (below league average is good)
-        era = getattr(player, "era", 0) or 0
-        whip = getattr(player, "whip", 0) or 0
-        ip = getattr(player, "ip", 0) or 0
-        k9 = getattr(player, "k9", 0) or 0
-
         if ip > 0 and era > 0:
             value += (4.50 - era) * (ip / 200.0)  # Scale by innings
         if ip > 0 and whip > 0:
@@ -458,59 +544,45 @@ def _calculate_sgp_denominators(
     Calculate the SGP denominator (standard deviation) for each category.
     """
     denominators = {}
+    columns = {}
+
+    def column(attr: str) -> np.ndarray:
+        # Each stat is read from the players once, however many categories use it
+        if attr not in columns:
+            columns[attr] = np.fromiter(
+                (getattr(p, attr, 0) or 0 for p in players),
+                dtype=np.float64,
+                count=len(players),
+            )
+        return columns[attr]
 
     for category in categories:
         cat_lower = category.lower()
+        stat = column(cat_lower)
 
         if player_type == "hitter" and cat_lower in HITTER_RATE_STATS:
             # For rate stats (AVG, OBP, SLG), use weighted values
-            values = []
-            for p in players:
-                ab = getattr(p, "ab", 0) or 0
-                pa = getattr(p, "pa", 0) or 0
-                stat = getattr(p, cat_lower, 0) or 0
-                # AVG and SLG weight by AB; OBP weights by PA
-                weight = pa if cat_lower == "obp" else ab
-                if weight > 0 and stat > 0:
-                    values.append(stat * weight)
-            if len(values) >= 2:
-                denominators[cat_lower] = statistics.stdev(values)
-            else:
-                denominators[cat_lower] = 1.0
-
-        elif player_type == "pitcher" and cat_lower in PITCHER_RATE_STATS:
-            # For pitcher rate stats (K/9), weight by IP (higher is better)
-            values = []
-            for p in players:
-                ip = getattr(p, "ip", 0) or 0
-                stat = getattr(p, cat_lower, 0) or 0
-                if ip > 0 and stat > 0:
-                    values.append(stat * ip)
-            if len(values) >= 2:
-                denominators[cat_lower] = statistics.stdev(values)
-            else:
-                denominators[cat_lower] = 1.0
-
-        elif player_type == "pitcher" and cat_lower in PITCHER_RATIO_STATS:
-            # For ratio stats, weight by IP
-            values = []
-            for p in players:
-                ip = getattr(p, "ip", 0) or 0
-                stat = getattr(p, cat_lower, 0) or 0
-                if ip > 0 and stat > 0:
-                    values.append(stat * ip)
-            if len(values) >= 2:
-                denominators[cat_lower] = statistics.stdev(values)
-            else:
-                denominators[cat_lower] = 1.0
+            # AVG and SLG weight by AB; OBP weights by PA
+            weight = column("pa" if cat_lower == "obp" else "ab")
+            values = (stat * weight)[(weight > 0) & (stat > 0)]
+
+        elif player_type == "pitcher" and (
+            cat_lower in PITCHER_RATE_STATS or cat_lower in PITCHER_RATIO_STATS
+        ):
+            # For pitcher rate stats (K/9) and ratio stats (ERA/WHIP), weight by IP
+            ip = column("ip")
+            values = (stat * ip)[(ip > 0) & (stat > 0)]
 
         else:
             # Counting stats
-            values = [getattr(p, cat_lower, 0) or 0 for p in players]
-            if len(values) >= 2:
-                denominators[cat_lower] = statistics.stdev(values)
-            else:
-                denominators[cat_lower] = 1.0
+            values = stat
+
+        # Identical values have no spread; checking min == max avoids the
+        # rounding residue a floating-point std leaves for constant input
+        if len(values) >= 2 and values.min() != values.max():
+            denominators[cat_lower] = float(values.std(ddof=1))
+        else:
+            denominators[cat_lower] = 1.0
 
         # Ensure non-zero denominator
         if denominators[cat_lower] == 0:
@@ -556,61 +628,142 @@ def _calculate_player_sgp(
         Tuple of (total_sgp, breakdown_dict) where breakdown_dict maps
         category names to their individual SGP contributions.
     """
-    total_sgp = 0.0
-    breakdown = {}
+    cats_lower = tuple(cat.lower() for cat in categories)
+    totals, breakdowns = _calculate_pool_sgp(
+        [player], cats_lower, player_type, replacement_stats, denominators
+    )
+    return float(totals[0]), dict(zip(cats_lower, breakdowns[0].tolist()))
 
-    for category in categories:
-        cat_lower = category.lower()
-        player_stat = getattr(player, cat_lower, 0) or 0
+
+def _calculate_pool_sgp(
+    players: list[Player],
+    cats_lower: tuple[str, ...],
+    player_type: str,
+    replacement_stats: dict[str, float],
+    denominators: dict[str, float],
+    columns: dict = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate SGP for a whole pool against one replacement level.
+
+    Each category is scored as one array operation over the pool instead
+    of once per player. Categories are added to the totals in order, so
+    results match summing a single player's categories one by one.
+
+    Args:
+        players: Players to score
+        cats_lower: Lowercased category names
+        player_type: "hitter" or "pitcher"
+        replacement_stats: Replacement level stats keyed by category
+        denominators: SGP denominators keyed by category
+        columns: Optional cache of stat arrays, shared between calls that
+            score the same players against different replacement levels
+
+    Returns:
+        Tuple of (totals, breakdowns): an array of total SGP per player and
+        an (N, len(cats_lower)) array of per-category SGP
+    """
+    if columns is None:
+        columns = {}
+
+    def column(getter) -> np.ndarray:
+        if getter not in columns:
+            columns[getter] = np.fromiter(
+                (getter(p) or 0 for p in players),
+                dtype=np.float64,
+                count=len(players),
+            )
+        return columns[getter]
+
+    totals = np.zeros(len(players))
+    breakdowns = np.empty((len(players), len(cats_lower)))
+
+    for index, (cat_lower, kind, stat_getter, weight_getter) in enumerate(
+        _sgp_plan(cats_lower, player_type)
+    ):
         replacement_stat = replacement_stats.get(cat_lower, 0)
         denominator = denominators.get(cat_lower, 1.0)
+        player_stat = column(stat_getter)
 
-        if player_type == "hitter" and cat_lower in HITTER_RATE_STATS:
-            # Rate stats (AVG, OBP, SLG): weighted by playing time
-            player_ab = getattr(player, "ab", 0) or 0
-            player_pa = getattr(player, "pa", 0) or 0
-            # AVG uses H vs expected H; OBP/SLG use direct rate difference × weight
-            if cat_lower == "avg":
-                player_h = getattr(player, "h", 0) or 0
-                if player_ab > 0 and replacement_stat > 0:
-                    expected_h = player_ab * replacement_stat
-                    sgp = (player_h - expected_h) / denominator
-                else:
-                    sgp = 0
+        if kind is _SGP_COUNTING:
+            # Counting stats: higher is better
+            sgp = (player_stat - replacement_stat) / denominator
+        elif kind is _SGP_AVG:
+            # AVG uses H vs expected H
+            player_ab = column(weight_getter)
+            if replacement_stat > 0:
+                expected_h = player_ab * replacement_stat
+                sgp = np.where(player_ab > 0, (player_stat - expected_h) / denominator, 0.0)
             else:
-                # OBP weights by PA, SLG weights by AB
-                weight = player_pa if cat_lower == "obp" else player_ab
-                if weight > 0:
-                    sgp = (player_stat - replacement_stat) * weight / denominator
-                else:
-                    sgp = 0
-
-        elif player_type == "pitcher" and cat_lower in PITCHER_RATE_STATS:
-            # K/9: Higher is better, weight by IP
-            player_ip = getattr(player, "ip", 0) or 0
-            if player_ip > 0 and player_stat > 0:
-                sgp = (player_stat - replacement_stat) * player_ip / denominator
+                sgp = np.zeros(len(players))
+        elif kind is _SGP_WEIGHTED:
+            # OBP/SLG: direct rate difference x PA/AB
+            weight = column(weight_getter)
+            sgp = np.where(
+                weight > 0, (player_stat - replacement_stat) * weight / denominator, 0.0
+            )
+        else:
+            # K/9 (higher is better) or ERA/WHIP (lower is better), weighted by IP
+            player_ip = column(weight_getter)
+            if kind is _SGP_IP_RATIO:
+                # Invert: replacement - player (so lower stat = positive SGP)
+                diff = replacement_stat - player_stat
             else:
-                sgp = 0
+                diff = player_stat - replacement_stat
+            sgp = np.where(
+                (player_ip > 0) & (player_stat > 0), diff * player_ip / denominator, 0.0
+            )
 
-        elif player_type == "pitcher" and cat_lower in PITCHER_RATIO_STATS:
-            # ERA/WHIP: Lower is better, weight by IP
-            player_ip = getattr(player, "ip", 0) or 0
+        breakdowns[:, index] = sgp
+        totals += sgp
 
-            if player_ip > 0 and player_stat > 0:
-                # Invert: replacement - player (so lower stat = positive SGP)
-                sgp = (replacement_stat - player_stat) * player_ip / denominator
-            else:
-                sgp = 0
+    return totals, breakdowns
 
-        else:
-            # Counting stats: higher is better
-            sgp = (player_stat - replacement_stat) / denominator
 
-        breakdown[cat_lower] = sgp
-        total_sgp += sgp
+# How _calculate_pool_sgp scores each category
+_SGP_COUNTING = "counting"
+_SGP_AVG = "avg"
+_SGP_WEIGHTED = "weighted"
+_SGP_IP_RATE = "ip_rate"
+_SGP_IP_RATIO = "ip_ratio"
+
 
-    return total_sgp, breakdown
+@lru_cache(maxsize=None)
+def _sgp_plan(cats_lower: tuple[str, ...], player_type: str) -> tuple:
+    """
+    Resolve each category to (cat, kind, stat getter, weight getter).
+
+    Category classification depends only on the category list and player
+    type, so it is worked out once per pool shape rather than once per
+    player and category.
+    """
+    plan = []
+    if player_type == "hitter":
+        getters = _HITTER_GETTERS
+        for cat in cats_lower:
+            if cat == "avg":
+                plan.append((cat, _SGP_AVG, getters["h"], getters["ab"]))
+            elif cat in HITTER_RATE_STATS:
+                # OBP weights by PA, SLG weights by AB
+                weight = getters["pa"] if cat == "obp" else getters["ab"]
+                plan.append((cat, _SGP_WEIGHTED, getters[cat], weight))
+            else:
+                plan.append((cat, _SGP_COUNTING, _stat_getter(getters, cat), None))
+    else:
+        getters = _PITCHER_GETTERS
+        for cat in cats_lower:
+            if cat in PITCHER_RATE_STATS:
+                plan.append((cat, _SGP_IP_RATE, getters[cat], getters["ip"]))
+            elif cat in PITCHER_RATIO_STATS:
+                plan.append((cat, _SGP_IP_RATIO, getters[cat], getters["ip"]))
+            else:
+                plan.append((cat, _SGP_COUNTING, _stat_getter(getters, cat), None))
+    return tuple(plan)
+
+
+def _stat_getter(getters: dict, cat: str):
+    """Return the accessor for a stat, scoring stats Player lacks as 0."""
+    return getters.get(cat) or (lambda player, attr=cat: getattr(player, attr, 0))
 
 
 def calculate_remaining_player_values(session: Session, settings: LeagueSettings = None) -> int:
@@ -650,6 +803,8 @@ def calculate_remaining_player_values(session: Session, settings: LeagueSettings
     # Calculate values for each pool with adjusted sizes and budgets
     hitter_budget = remaining_budget * settings.hitter_budget_pct
     pitcher_budget = remaining_budget * (1 - settings.hitter_budget_pct)
+    min_bid = settings.min_bid
+    updates = []
 
     if settings.use_positional_adjustments:
         # Create adjusted settings with remaining slots for positional calculation
@@ -661,6 +816,7 @@ def calculate_remaining_player_values(session: Session, settings: LeagueSettings
             categories=settings.hitting_categories,
             player_type="hitter",
             settings=remaining_settings,
+            updates=updates,
         )
 
         pitcher_count = _calculate_positional_values(
@@ -669,6 +825,7 @@ def calculate_remaining_player_values(session: Session, settings: LeagueSettings
             categories=settings.pitching_categories,
             player_type="pitcher",
             settings=remaining_settings,
+            updates=updates,
         )
     else:
         hitter_count = _calculate_pool_values(
@@ -677,7 +834,8 @@ def calculate_remaining_player_values(session: Session, settings: LeagueSettings
             budget=hitter_budget,
             categories=settings.hitting_categories,
             player_type="hitter",
-            min_bid=settings.min_bid,
+            updates=updates,
+            min_bid=min_bid,
         )
 
         pitcher_count = _calculate_pool_values(
@@ -686,9 +844,12 @@ def calculate_remaining_player_values(session: Session, settings: LeagueSettings
             budget=pitcher_budget,
             categories=settings.pitching_categories,
             player_type="pitcher",
-            min_bid=settings.min_bid,
+            updates=updates,
+            min_bid=min_bid,
         )
 
+    _write_player_values(session, updates)
+
     # Clear stale flag
     if draft_state:
         draft_state.values_stale = False
@@ -890,20 +1051,40 @@ def calculate_category_surplus(player: Player, price_paid: int) -> dict[str, flo
     if player.sgp is None:
         return {}
 
+    breakdown = player.sgp_breakdown
     total_surplus = (player.dollar_value or 0) - price_paid
     total_sgp = player.sgp
 
     if total_sgp == 0:
         # Distribute evenly if no SGP differentiation
-        num_cats = len(player.sgp_breakdown)
-        if num_cats == 0:
-            return {}
-        return {cat: total_surplus / num_cats for cat in player.sgp_breakdown}
+        return dict.fromkeys(breakdown, total_surplus / len(breakdown))
 
-    return {
-        cat: (cat_sgp / total_sgp) * total_surplus
-        for cat, cat_sgp in player.sgp_breakdown.items()
-    }
+    # One division for the whole player; each category is then a multiply
+    surplus_per_sgp = total_surplus / total_sgp
+    return {cat: cat_sgp * surplus_per_sgp for cat, cat_sgp in breakdown.items()}
+
+
+def load_team_picks(session: Session, team_id: int) -> list[DraftPick]:
+    """
+    Load a team's draft picks with their players eagerly joined.
+
+    The team category functions read pick.player for every pick; joining the
+    players into the same query avoids one lazy SELECT per pick.
+
+    Args:
+        session: Database session
+        team_id: ID of the team
+
+    Returns:
+        List of DraftPick objects ordered by pick number
+    """
+    return (
+        session.query(DraftPick)
+        .options(joinedload(DraftPick.player))
+        .filter(DraftPick.team_id == team_id)
+        .order_by(DraftPick.pick_number)
+        .all()
+    )
 
 
 def calculate_team_category_sgp(picks: list, settings: LeagueSettings = None) -> dict[str, float]:
@@ -911,7 +1092,7 @@ def calculate_team_category_sgp(picks: list, settings: LeagueSettings = None) ->
     Sum SGP per category for all team players.
 
     Args:
-        picks: List of DraftPick objects (from team.draft_picks)
+        picks: List of DraftPick objects (from load_team_picks or team.draft_picks)
         settings: League settings (uses DEFAULT_SETTINGS if None)
 
     Returns:
@@ -929,10 +1110,11 @@ def calculate_team_category_sgp(picks: list, settings: LeagueSettings = None) ->
 
     for pick in picks:
         player = pick.player
-        if player and player.sgp_breakdown:
-            for cat, sgp in player.sgp_breakdown.items():
-                if cat in totals:
-                    totals[cat] += sgp
+        if player is None or not player.sgp_breakdown:
+            continue
+        for cat, sgp in player.sgp_breakdown.items():
+            if cat in totals:
+                totals[cat] += sgp
 
     return totals
 
@@ -942,7 +1124,7 @@ def calculate_team_raw_stats(picks: list, settings: LeagueSettings = None) -> di
     Sum raw stat projections (counting) or weighted avg (ratio stats).
 
     Args:
-        picks: List of DraftPick objects (from team.draft_picks)
+        picks: List of DraftPick objects (from load_team_picks or team.draft_picks)
         settings: League settings (uses DEFAULT_SETTINGS if None)
 
     Returns:
@@ -954,43 +1136,55 @@ def calculate_team_raw_stats(picks: list, settings: LeagueSettings = None) -> di
     hitting_cats = [c.lower() for c in settings.hitting_categories]
     pitching_cats = [c.lower() for c in settings.pitching_categories]
 
-    stats = {}
-    total_ab = 0
-    total_h = 0
-    total_ip = 0
-    weighted_era = 0
-    weighted_whip = 0
+    # Accumulate in locals; the result dict is built once after the loop
+    r = hr = rbi = sb = 0
+    w = sv = k = hld = 0
+    total_ab = total_h = total_ip = 0
+    weighted_era = weighted_whip = 0
+    has_hitter = has_pitcher = False
 
     for pick in picks:
         player = pick.player
-        if not player:
+        if player is None:
             continue
 
         if player.player_type == "hitter":
-            # Counting stats
-            for cat in hitting_cats:
-                if cat in HITTER_COUNTING_STATS:
-                    stats[cat] = stats.get(cat, 0) + (getattr(player, cat, 0) or 0)
+            has_hitter = True
+            r += player.r or 0
+            hr += player.hr or 0
+            rbi += player.rbi or 0
+            sb += player.sb or 0
 
             # Track AB/H for AVG calculation
-            ab = getattr(player, "ab", 0) or 0
-            h = getattr(player, "h", 0) or 0
-            total_ab += ab
-            total_h += h
+            total_ab += player.ab or 0
+            total_h += player.h or 0
 
         elif player.player_type == "pitcher":
-            # Counting stats
-            for cat in pitching_cats:
-                if cat in PITCHER_COUNTING_STATS:
-                    stats[cat] = stats.get(cat, 0) + (getattr(player, cat, 0) or 0)
+            has_pitcher = True
+            w += player.w or 0
+            sv += player.sv or 0
+            k += player.k or 0
+            hld += player.hld or 0
 
             # Track IP-weighted ERA/WHIP
-            ip = getattr(player, "ip", 0) or 0
-            era = getattr(player, "era", 0) or 0
-            whip = getattr(player, "whip", 0) or 0
+            ip = player.ip or 0
             total_ip += ip
-            weighted_era += era * ip
-            weighted_whip += whip * ip
+            weighted_era += (player.era or 0) * ip
+            weighted_whip += (player.whip or 0) * ip
+
+    stats = {}
+
+    # Counting stats appear only for categories the roster has players for
+    if has_hitter:
+        hitter_totals = {"r": r, "hr": hr, "rbi": rbi, "sb": sb}
+        for cat in hitting_cats:
+            if cat in hitter_totals:
+                stats[cat] = hitter_totals[cat]
+    if has_pitcher:
+        pitcher_totals = {"w": w, "sv": sv, "k": k, "hld": hld}
+        for cat in pitching_cats:
+            if cat in pitcher_totals:
+                stats[cat] = pitcher_totals[cat]
 
     # Calculate team AVG
     if total_ab > 0:
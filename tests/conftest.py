@@ -2,27 +2,63 @@
 
 import pytest
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from src.database import Base, Player, Team, DraftPick, TargetPlayer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
+    """
+    Create one in-memory SQLite database shared by the whole test run.
+
+    The schema is created once; each test's session runs inside a
+    transaction that is rolled back afterwards, so tests never see each
+    other's rows.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Test data is throwaway, so skip journaling and fsync entirely
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest correctly
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
 def session(engine):
-    """Create a database session for testing."""
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    """
+    Create a database session whose changes are rolled back after each test.
+
+    Commits made by the code under test only release SAVEPOINTs inside the
+    outer transaction.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
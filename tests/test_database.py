@@ -166,6 +166,23 @@ class TestDatabaseFunctions:
         engine = get_engine(str(db_path))
         assert engine is not None
 
+    def test_get_engine_stores_compact_json(self, tmp_path):
+        """Test that JSON columns are written without padding and read back as dicts."""
+        from sqlalchemy import text
+
+        engine = init_db(str(tmp_path / "test.db"))
+        session = get_session(engine)
+        player = Player(name="Json", player_type="hitter", sgp_breakdown={"r": 1.5, "hr": 2.0})
+        session.add(player)
+        session.commit()
+
+        raw = session.execute(text("SELECT sgp_breakdown FROM players")).scalar()
+        assert raw == '{"r":1.5,"hr":2.0}'
+
+        session.expire_all()
+        assert player.sgp_breakdown == {"r": 1.5, "hr": 2.0}
+        session.close()
+
     def test_init_db(self, tmp_path):
         """Test database initialization."""
         db_path = tmp_path / "test.db"
@@ -115,6 +115,16 @@ class TestLeagueSettings:
         settings = LeagueSettings()
         assert settings.hitter_budget_pct == 0.68
 
+    def test_positional_demand_is_cached(self):
+        """Test positional demand is computed once and handed out as copies."""
+        settings = LeagueSettings()
+
+        assert settings.positional_demand is settings.positional_demand
+
+        demand = settings.get_positional_demand()
+        demand["C"] = 0
+        assert settings.positional_demand["C"] == 12
+
 
 class TestDefaultSettings:
     """Tests for DEFAULT_SETTINGS instance."""
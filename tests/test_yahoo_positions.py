@@ -8,40 +8,39 @@ from src.database import Player
 class TestNormalizeName:
     """Tests for name normalization."""
 
-    def test_basic_name(self):
-        assert normalize_name("Mike Trout") == "mike trout"
-
-    def test_accented_characters(self):
-        assert normalize_name("José Ramírez") == "jose ramirez"
-
-    def test_jr_suffix(self):
-        assert normalize_name("Fernando Tatis Jr.") == "fernando tatis"
-
-    def test_iii_suffix(self):
-        assert normalize_name("Ronald Acuna III") == "ronald acuna"
-
-    def test_parenthetical(self):
-        assert normalize_name("Shohei Ohtani (Hitter)") == "shohei ohtani"
-
-    def test_periods_removed(self):
-        assert normalize_name("J.T. Realmuto") == "jt realmuto"
-
-    def test_extra_whitespace(self):
-        assert normalize_name("  Juan   Soto  ") == "juan soto"
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            pytest.param("Mike Trout", "mike trout", id="basic_name"),
+            pytest.param("José Ramírez", "jose ramirez", id="accented_characters"),
+            pytest.param("Fernando Tatis Jr.", "fernando tatis", id="jr_suffix"),
+            pytest.param("Ronald Acuna III", "ronald acuna", id="iii_suffix"),
+            pytest.param("Shohei Ohtani (Hitter)", "shohei ohtani", id="parenthetical"),
+            pytest.param("J.T. Realmuto", "jt realmuto", id="periods_removed"),
+            pytest.param("  Juan   Soto  ", "juan soto", id="extra_whitespace"),
+        ],
+    )
+    def test_normalize_name(self, name, expected):
+        assert normalize_name(name) == expected
 
 
 class TestFormatPositions:
     """Tests for Yahoo position formatting."""
 
-    def test_basic_positions(self):
-        assert format_positions(["C", "1B"]) == "C,1B"
-
-    def test_filters_meta_positions(self):
-        assert format_positions(["SS", "Util", "BN"]) == "SS"
-
-    def test_outfield_consolidation(self):
-        result = format_positions(["LF", "CF", "RF", "Util"])
-        assert result == "OF"
+    @pytest.mark.parametrize(
+        "eligible, expected",
+        [
+            pytest.param(["C", "1B"], "C,1B", id="basic_positions"),
+            pytest.param(["SS", "Util", "BN"], "SS", id="filters_meta_positions"),
+            pytest.param(["LF", "CF", "RF", "Util"], "OF", id="outfield_consolidation"),
+            pytest.param([], "", id="empty_list"),
+            pytest.param(["Util"], "UTIL", id="util_only_kept_as_util"),
+            pytest.param(["BN", "IL"], "", id="other_meta_positions_filtered"),
+            pytest.param(["SP", "RP"], "SP,RP", id="pitcher_positions"),
+        ],
+    )
+    def test_format_positions(self, eligible, expected):
+        assert format_positions(eligible) == expected
 
     def test_outfield_with_other_positions(self):
         result = format_positions(["CF", "DH", "Util"])
@@ -49,26 +48,12 @@ class TestFormatPositions:
         assert "DH" in result
         assert "Util" not in result
 
-    def test_empty_list(self):
-        assert format_positions([]) == ""
-
-    def test_util_only_kept_as_util(self):
-        assert format_positions(["Util"]) == "UTIL"
-
-    def test_other_meta_positions_filtered(self):
-        assert format_positions(["BN", "IL"]) == ""
-
-    def test_pitcher_positions(self):
-        assert format_positions(["SP", "RP"]) == "SP,RP"
-
 
 class TestMatchPlayers:
     """Tests for player matching logic."""
 
-    def test_exact_match(self, session):
+    def test_exact_match(self):
         player = Player(name="Mike Trout", team="LAA", player_type="hitter")
-        session.add(player)
-        session.commit()
 
         yahoo_players = {
             "123": {"player_id": "123", "name": "Mike Trout",
@@ -80,10 +65,8 @@ class TestMatchPlayers:
         assert matched[0][2] == 1.0  # exact match score
         assert len(unmatched) == 0
 
-    def test_fuzzy_match_accents(self, session):
+    def test_fuzzy_match_accents(self):
         player = Player(name="Jose Ramirez", team="CLE", player_type="hitter")
-        session.add(player)
-        session.commit()
 
         yahoo_players = {
             "456": {"player_id": "456", "name": "José Ramírez",
@@ -94,12 +77,28 @@ class TestMatchPlayers:
         assert len(matched) == 1
         assert len(unmatched) == 0
 
-    def test_split_player_match(self, session):
+    def test_fuzzy_match_picks_closest(self):
+        player = Player(name="Jazz Chisholm", team="NYY", player_type="hitter")
+
+        yahoo_players = {
+            "1": {"player_id": "1", "name": "Jake Chisholm",
+                  "eligible_positions": ["OF"], "position_type": "B"},
+            "2": {"player_id": "2", "name": "Jaz Chisolm",
+                  "eligible_positions": ["2B"], "position_type": "B"},
+            "3": {"player_id": "3", "name": "Jazz Chisolm",
+                  "eligible_positions": ["3B"], "position_type": "B"},
+        }
+
+        matched, unmatched = match_players(yahoo_players, [player])
+        assert len(matched) == 1
+        assert matched[0][1]["player_id"] == "3"
+        assert 0.85 <= matched[0][2] < 1.0
+        assert len(unmatched) == 0
+
+    def test_split_player_match(self):
         """Test that split players (e.g., Ohtani) match by type."""
         hitter = Player(name="Shohei Ohtani", team="LAD", player_type="hitter")
         pitcher = Player(name="Shohei Ohtani", team="LAD", player_type="pitcher")
-        session.add_all([hitter, pitcher])
-        session.commit()
 
         yahoo_players = {
             "100": {"player_id": "100", "name": "Shohei Ohtani (Hitter)",
@@ -112,15 +111,12 @@ class TestMatchPlayers:
         assert len(matched) == 2
         assert len(unmatched) == 0
         # Verify correct type mapping
-        hitter_match = next(m for m in matched if m[0].player_type == "hitter")
-        pitcher_match = next(m for m in matched if m[0].player_type == "pitcher")
-        assert hitter_match[1]["player_id"] == "100"
-        assert pitcher_match[1]["player_id"] == "200"
+        by_type = {player.player_type: yahoo for player, yahoo, _ in matched}
+        assert by_type["hitter"]["player_id"] == "100"
+        assert by_type["pitcher"]["player_id"] == "200"
 
-    def test_no_match(self, session):
+    def test_no_match(self):
         player = Player(name="Fake Player", team="XXX", player_type="hitter")
-        session.add(player)
-        session.commit()
 
         yahoo_players = {
             "789": {"player_id": "789", "name": "Real Player",